@@ -15,13 +15,16 @@ for line in sys.stdin:
             coords[_id] = (x,y,z)
 
 
-xs = [x[0] for x in coords.values()]
-ys = [x[1] for x in coords.values()]
-zs = [x[2] for x in coords.values()]
-
-min_x, max_x = min(xs), max(xs)
-min_y, max_y = min(ys), max(ys)
-min_z, max_z = min(zs), max(zs)
+# Bounding box in a single pass over all coordinates
+min_x = min_y = min_z = float('inf')
+max_x = max_y = max_z = float('-inf')
+for x, y, z in coords.values():
+    if x < min_x: min_x = x
+    if x > max_x: max_x = x
+    if y < min_y: min_y = y
+    if y > max_y: max_y = y
+    if z < min_z: min_z = z
+    if z > max_z: max_z = z
 
 normalized = {}
 for _id, (x, y, z) in coords.items():
@@ -30,15 +33,25 @@ for _id, (x, y, z) in coords.items():
     norm_z = 2 * (z - min_z) / (max_z - min_z) - 1 if max_z != min_z else 0
     normalized[_id] = (norm_x, norm_y, norm_z)
 
-# Find outliers (extremes on each axis and furthest from center)
+# Find outliers (extremes on each axis and furthest from center) in a single pass
 import math
-max_x_id = max(normalized.items(), key=lambda item: item[1][0])
-min_x_id = min(normalized.items(), key=lambda item: item[1][0])
-max_y_id = max(normalized.items(), key=lambda item: item[1][1])
-min_y_id = min(normalized.items(), key=lambda item: item[1][1])
-max_z_id = max(normalized.items(), key=lambda item: item[1][2])
-min_z_id = min(normalized.items(), key=lambda item: item[1][2])
-max_dist_id = max(normalized.items(), key=lambda item: math.sqrt(item[1][0]**2 + item[1][1]**2 + item[1][2]**2))
+items = iter(normalized.items())
+max_x_id = min_x_id = max_y_id = min_y_id = max_z_id = min_z_id = max_dist_id = next(items)
+x, y, z = max_dist_id[1]
+max_dist_sq = x*x + y*y + z*z
+for item in items:
+    x, y, z = item[1]
+    if x > max_x_id[1][0]: max_x_id = item
+    if x < min_x_id[1][0]: min_x_id = item
+    if y > max_y_id[1][1]: max_y_id = item
+    if y < min_y_id[1][1]: min_y_id = item
+    if z > max_z_id[1][2]: max_z_id = item
+    if z < min_z_id[1][2]: min_z_id = item
+    # Compare squared distances, take the sqrt only once for the winner
+    dist_sq = x*x + y*y + z*z
+    if dist_sq > max_dist_sq:
+        max_dist_sq = dist_sq
+        max_dist_id = item
 
 print("=== Maximum Outlier Coordinates ===", file=sys.stderr)
 print(f"Max X: LED_{max_x_id[0]} at ({max_x_id[1][0]:.6f}, {max_x_id[1][1]:.6f}, {max_x_id[1][2]:.6f})", file=sys.stderr)
@@ -47,7 +60,7 @@ print(f"Max Y: LED_{max_y_id[0]} at ({max_y_id[1][0]:.6f}, {max_y_id[1][1]:.6f},
 print(f"Min Y: LED_{min_y_id[0]} at ({min_y_id[1][0]:.6f}, {min_y_id[1][1]:.6f}, {min_y_id[1][2]:.6f})", file=sys.stderr)
 print(f"Max Z: LED_{max_z_id[0]} at ({max_z_id[1][0]:.6f}, {max_z_id[1][1]:.6f}, {max_z_id[1][2]:.6f})", file=sys.stderr)
 print(f"Min Z: LED_{min_z_id[0]} at ({min_z_id[1][0]:.6f}, {min_z_id[1][1]:.6f}, {min_z_id[1][2]:.6f})", file=sys.stderr)
-dist = math.sqrt(max_dist_id[1][0]**2 + max_dist_id[1][1]**2 + max_dist_id[1][2]**2)
+dist = math.sqrt(max_dist_sq)
 print(f"Furthest from center: LED_{max_dist_id[0]} at ({max_dist_id[1][0]:.6f}, {max_dist_id[1][1]:.6f}, {max_dist_id[1][2]:.6f}), distance={dist:.6f}", file=sys.stderr)
 print("===================================", file=sys.stderr)
 
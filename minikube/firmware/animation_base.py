@@ -1,6 +1,7 @@
 # Base Animation Class
 # Similar to Mode pattern in testdevice.py but adapted for 3D coordinate-based animations
 
+import array
 import config
 import micropython
 
@@ -8,7 +9,8 @@ import micropython
 class Animation:
     """
     Base class for all LED cube animations.
-    Subclasses must implement get_color() method.
+    Subclasses must implement get_color() method, and may override
+    get_color_batch() to render all LEDs in a single fused loop.
     """
 
     def __init__(self, coords, current_time):
@@ -16,11 +18,40 @@ class Animation:
         Initialize animation.
 
         Args:
-            coords: List of (x, y, z) tuples or None from coordinate_loader
+            coords: Coordinates from coordinate_loader
             current_time: Starting time in milliseconds (from time.ticks_ms())
         """
         self.coords = coords
         self.start_time = current_time
+        self.num_leds = len(coords)
+
+        # Validate once here so the per-frame loops need no error handling
+        # (the loader returns an empty Coordinates if solution1.txt is bad)
+        if self.num_leds == 0:
+            raise ValueError("No LED coordinates loaded")
+
+        # Structure-of-arrays coordinates for batched rendering
+        # Missing LEDs are stored as (0, 0, 0) and masked out via self.valid
+        self.xs = coords.xs
+        self.ys = coords.ys
+        self.zs = coords.zs
+        self.valid = coords.valid
+
+        # Coordinates centered to [-0.5, 0.5], precomputed since they never change
+        self.cx = array.array('f', [x - 0.5 for x in self.xs])
+        self.cy = array.array('f', [y - 0.5 for y in self.ys])
+        self.cz = array.array('f', [z - 0.5 for z in self.zs])
+
+        # Global brightness (0-255), applied by get_color_batch()
+        self.brightness = config.BRIGHTNESS
+
+        # Preallocated uint8 output buffers filled by get_color_batch() every frame
+        self.out_r = bytearray(self.num_leds)
+        self.out_g = bytearray(self.num_leds)
+        self.out_b = bytearray(self.num_leds)
+
+        # Preallocated frame in strip byte order, copied into np.buf in one go
+        self.frame = bytearray(3 * self.num_leds)
 
     def get_color(self, x, y, z, t, led_id):
         """
@@ -39,61 +70,109 @@ class Animation:
         """
         raise NotImplementedError("Subclasses must implement get_color()")
 
+    def precompute_frame(self, t):
+        """
+        Compute values that are constant across all LEDs for this frame.
+        Called by update() once per frame before any colors are computed;
+        subclasses store the results on self for get_color()/get_color_batch().
+
+        Args:
+            t: Time in seconds since animation start
+        """
+        pass
+
+    @micropython.native
+    def get_color_batch(self, t, out_r, out_g, out_b):
+        """
+        Compute colors for all LEDs in one call.
+        Default implementation calls get_color() per LED with the normalized
+        self.xs/ys/zs; subclasses can override this with a fused loop to
+        avoid per-LED method dispatch (reading self.xs/ys/zs or the
+        centered self.cx/cy/cz, whichever they need).
+
+        Args:
+            t: Time in seconds since animation start
+            out_r, out_g, out_b: uint8 output buffers receiving final strip
+                values (0 to 255, clamped, self.brightness applied)
+        """
+        get_color = self.get_color
+        xs = self.xs
+        ys = self.ys
+        zs = self.zs
+        valid = self.valid
+        brightness = self.brightness
+
+        for led_id in range(len(valid)):
+            # Handle missing coordinates - skip
+            if not valid[led_id]:
+                continue
+
+            # Coordinates are passed straight from the SoA buffers and the
+            # result is indexed directly (cheaper than tuple unpacking)
+            color = get_color(xs[led_id], ys[led_id], zs[led_id], t, led_id)
+
+            # Clamp to valid range, convert to 0-255 and apply brightness in one step
+            out_r[led_id] = int(min(1.0, max(0.0, color[0])) * brightness)
+            out_g[led_id] = int(min(1.0, max(0.0, color[1])) * brightness)
+            out_b[led_id] = int(min(1.0, max(0.0, color[2])) * brightness)
+
     @micropython.native
     def update(self, current_time, np):
         """
-        Update all LEDs - optimized with native compilation and cached locals.
+        Update all LEDs - renders a whole frame of uint8 colors via
+        get_color_batch(), then writes the results to the strip.
         """
         # Cache values in local variables for speed
-        coords = self.coords
-        start_time = self.start_time
-        brightness = config.BRIGHTNESS
+        valid = self.valid
+        out_r = self.out_r
+        out_g = self.out_g
+        out_b = self.out_b
         external_start = config.EXTERNAL_START
-        get_color = self.get_color
-        np_len = len(np)
 
         # Calculate elapsed time in seconds
-        t = (current_time - start_time) / 1000.0
-
-        # Update all cube LEDs (coordinates are 0-indexed, offset for physical strip)
-        for led_id in range(len(coords)):
-            coord = coords[led_id]
-
-            # Handle missing coordinates - skip
-            if coord is None:
+        t = (current_time - self.start_time) / 1000.0
+
+        # Render all cube LEDs at once
+        self.precompute_frame(t)
+        self.get_color_batch(t, out_r, out_g, out_b)
+
+        # Only write LEDs that exist on the physical strip
+        n = len(np) - external_start
+        if n > self.num_leds:
+            n = self.num_leds
+
+        # Fallback for strips without a raw 3-byte-per-pixel buffer
+        # (e.g. RGBW strips, whose extra channels are set to 0)
+        bpp = getattr(np, 'bpp', 3)
+        if bpp != 3 or not hasattr(np, 'buf'):
+            pad = (0,) * (bpp - 3) if bpp > 3 else ()
+            for led_id in range(n):
+                if not valid[led_id]:
+                    continue
+
+                # Offset for built-in LEDs on the physical strip
+                np[led_id + external_start] = (out_r[led_id], out_g[led_id], out_b[led_id]) + pad
+            return
+
+        # Build the frame directly in the strip's channel order (e.g. GRB)
+        frame = self.frame
+        order = np.ORDER
+        r_off = order[0]
+        g_off = order[1]
+        b_off = order[2]
+
+        for led_id in range(n):
+            if not valid[led_id]:
                 continue
 
-            # Get normalized coordinates
-            x, y, z = coord
-
-            # Get color from subclass implementation
-            try:
-                r, g, b = get_color(x, y, z, t, led_id)
-
-                # Clamp to valid range
-                if r < 0.0:
-                    r = 0.0
-                elif r > 1.0:
-                    r = 1.0
-                if g < 0.0:
-                    g = 0.0
-                elif g > 1.0:
-                    g = 1.0
-                if b < 0.0:
-                    b = 0.0
-                elif b > 1.0:
-                    b = 1.0
-
-                # Convert to 0-255 range and apply brightness in one step
-                r_scaled = int(r * brightness)
-                g_scaled = int(g * brightness)
-                b_scaled = int(b * brightness)
-
-                # Write to physical LED strip with offset for built-in LEDs
-                physical_led_id = led_id + external_start
-                if physical_led_id < np_len:
-                    np[physical_led_id] = (r_scaled, g_scaled, b_scaled)
-
-            except:
-                # On error, skip this LED silently
-                pass
+            offset = led_id * 3
+            frame[offset + r_off] = out_r[led_id]
+            frame[offset + g_off] = out_g[led_id]
+            frame[offset + b_off] = out_b[led_id]
+
+        # Single slice copy into the strip buffer, offset for built-in LEDs
+        start = external_start * 3
+        if n == self.num_leds:
+            np.buf[start:start + 3 * n] = frame
+        else:
+            np.buf[start:start + 3 * n] = memoryview(frame)[:3 * n]
@@ -4,11 +4,13 @@
 #   - "scramble": LED position scrambling effect (default, matches original JS)
 #   - "color": Hue cycling through color spectrum (like sphere animation)
 
+import array
 import micropython
 from animation_base import Animation
-from fast_math import fast_sin, fast_cos
-from hash_utils import hash_led_id
-from color_hsv import hsv_to_rgb
+from fast_math import radians_to_angle16, fast_sin_q, fast_cos_q, Q15_SCALE
+from hash_utils import scramble_tables
+from color_hsv import hsv_to_rgb_int
+from color_utils import COLOR_ONE, COLOR_SCALE, rgb_to_fixed, scale_color_brightness
 
 
 class PlaneAnimation(Animation):
@@ -19,20 +21,19 @@ class PlaneAnimation(Animation):
     def __init__(self, coords, current_time):
         super().__init__(coords, current_time)
 
-        # Store coords for scramble effect
-        self.coords = coords
-        self.num_leds = len(coords)
-
-        # Pre-compute scramble lookup tables for performance
+        # Pre-computed (and cached) scramble lookup tables for performance
         # This avoids calling hash_led_id() twice per LED per frame
-        self.foreign_ids = [0] * self.num_leds
-        self.swap_thresholds_int = [0] * self.num_leds
-
-        for led_id in range(self.num_leds):
-            # Pre-compute foreign LED ID
-            self.foreign_ids[led_id] = hash_led_id(led_id) % self.num_leds
-            # Pre-compute swap threshold as integer (0-999) for faster comparison
-            self.swap_thresholds_int[led_id] = hash_led_id(led_id, 123) % 1000
+        self.foreign_ids, self.swap_thresholds_int = scramble_tables(self.num_leds)
+
+        # Pre-gather (centered) foreign positions so the scramble swap is a plain array read
+        cx = self.cx
+        cy = self.cy
+        cz = self.cz
+        valid = self.valid
+        self.foreign_cx = array.array('f', [cx[i] for i in self.foreign_ids])
+        self.foreign_cy = array.array('f', [cy[i] for i in self.foreign_ids])
+        self.foreign_cz = array.array('f', [cz[i] for i in self.foreign_ids])
+        self.foreign_valid = bytearray([valid[i] for i in self.foreign_ids])
 
         # Auto mode enabled by default
         self.auto_mode = True
@@ -71,109 +72,213 @@ class PlaneAnimation(Animation):
         self.back_g = 0.0
         self.back_b = 0.0
 
-    @micropython.native
-    def get_color(self, x, y, z, t, led_id):
+        # Per-frame front color, rotation and scramble strength, set by precompute_frame()
+        # (front/back colors as fixed-point 0-COLOR_ONE)
+        self.frame_front_r = 0
+        self.frame_front_g = 0
+        self.frame_front_b = 0
+        self.frame_back_r = 0
+        self.frame_back_g = 0
+        self.frame_back_b = 0
+        self.cos_x = 1.0
+        self.sin_x = 0.0
+        self.cos_z = 1.0
+        self.sin_z = 0.0
+        self.scramble_strength_int = 0
+
+    def precompute_frame(self, t):
         """
-        Calculate color - with scramble effect for auto mode.
+        Compute the front color, rotation sin/cos and scramble strength
+        once per frame instead of per LED.
         """
-        # Cache self properties
-        auto_mode = self.auto_mode
-        auto_mode_style = self.auto_mode_style
-        speed_x = self.rotation_speed_x
-        speed_z = self.rotation_speed_z
-        edge = self.edge_smoothness
-        back_r = self.back_r
-        back_g = self.back_g
-        back_b = self.back_b
+        # Scramble timing (integer % and //) only depends on t
+        self.scramble_strength_int = self.get_scramble_strength(t)
+
+        # Calculate rotation angles as 16-bit binary angles for the integer sine table
+        rot_x = radians_to_angle16(self.rotation_speed_x * t)
+        rot_z = radians_to_angle16(self.rotation_speed_z * t)
+
+        # Rotation sin/cos (using Q15 viper trig)
+        self.cos_x = fast_cos_q(rot_x) * Q15_SCALE
+        self.sin_x = fast_sin_q(rot_x) * Q15_SCALE
+        self.cos_z = fast_cos_q(rot_z) * Q15_SCALE
+        self.sin_z = fast_sin_q(rot_z) * Q15_SCALE
 
         # Determine front color based on auto mode
-        if auto_mode and auto_mode_style == "color":
+        if self.auto_mode and self.auto_mode_style == "color":
             # Color cycle mode: hue cycling like sphere animation
             current_hue = (t / self.hue_cycle_duration) % 1.0
-            front_r, front_g, front_b = hsv_to_rgb(current_hue, self.auto_saturation, self.auto_brightness)
+            # Integer math: hue and saturation as Q16, value as fixed-point color;
+            # s and v are clamped so every channel stays within 0-COLOR_ONE
+            self.frame_front_r, self.frame_front_g, self.frame_front_b = hsv_to_rgb_int(
+                int(current_hue * 65536),
+                int(max(0.0, min(1.0, self.auto_saturation)) * 65536),
+                int(max(0.0, min(1.0, self.auto_brightness)) * COLOR_ONE))
         else:
             # Use base front color (light blue)
-            front_r = self.front_r
-            front_g = self.front_g
-            front_b = self.front_b
-
-        # Calculate scramble strength for scramble auto mode (using integer math)
-        scramble_strength_int = 0
-        if auto_mode and auto_mode_style == "scramble":
-            # Convert time to milliseconds for integer math
-            t_ms = int(t * 1000)
-
-            # Calculate cycle timing in integer milliseconds
-            cycle_time_ms = t_ms % self.total_cycle_time_ms
-            is_transitioning = cycle_time_ms >= self.hold_duration_ms
-
-            # Which cycle are we in?
-            current_cycle = t_ms // self.total_cycle_time_ms
-            transition_up = (current_cycle % 2) == 0
-
-            if is_transitioning:
-                # During transition: calculate strength as integer 0-1000
-                elapsed_transition_ms = cycle_time_ms - self.hold_duration_ms
-                scramble_strength_int = (elapsed_transition_ms * 1000) // self.transition_duration_ms
-                if not transition_up:
-                    # 1000 → 0
-                    scramble_strength_int = 1000 - scramble_strength_int
-            else:
-                # During hold: stay at extreme values
-                scramble_strength_int = 0 if transition_up else 1000
+            self.frame_front_r, self.frame_front_g, self.frame_front_b = rgb_to_fixed(
+                self.front_r, self.front_g, self.front_b)
+
+        self.frame_back_r, self.frame_back_g, self.frame_back_b = rgb_to_fixed(
+            self.back_r, self.back_g, self.back_b)
+
+    @micropython.native
+    def get_scramble_strength(self, t):
+        """
+        Calculate scramble strength for scramble auto mode (using integer math).
+        Depends only on t, so it is the same for every LED in a frame.
+
+        Returns:
+            Scramble strength as integer 0-1000 (0 when not scrambling)
+        """
+        if not (self.auto_mode and self.auto_mode_style == "scramble"):
+            return 0
+
+        # Convert time to milliseconds for integer math
+        t_ms = int(t * 1000)
+
+        # Calculate cycle timing in integer milliseconds
+        cycle_time_ms = t_ms % self.total_cycle_time_ms
+        is_transitioning = cycle_time_ms >= self.hold_duration_ms
+
+        # Which cycle are we in?
+        current_cycle = t_ms // self.total_cycle_time_ms
+        transition_up = (current_cycle % 2) == 0
+
+        if is_transitioning:
+            # During transition: calculate strength as integer 0-1000
+            elapsed_transition_ms = cycle_time_ms - self.hold_duration_ms
+            scramble_strength_int = (elapsed_transition_ms * 1000) // self.transition_duration_ms
+            if not transition_up:
+                # 1000 → 0
+                scramble_strength_int = 1000 - scramble_strength_int
+            return scramble_strength_int
+
+        # During hold: stay at extreme values
+        return 0 if transition_up else 1000
+
+    @micropython.native
+    def get_color(self, x, y, z, t, led_id):
+        """
+        Calculate color - with scramble effect for auto mode.
+        """
+        # Scramble strength computed once per frame by precompute_frame()
+        scramble_strength_int = self.scramble_strength_int
 
         # Apply scramble effect: binary swap between true and foreign positions
-        final_x = x
-        final_y = y
-        final_z = z
+        # Integer comparison (scramble_strength_int is 0-1000)
+        if scramble_strength_int > self.swap_thresholds_int[led_id] and self.foreign_valid[led_id]:
+            # Use pre-gathered foreign position (avoids hash call and lookup),
+            # un-centered back to [0.0, 1.0] for get_plane_color()
+            x = self.foreign_cx[led_id] + 0.5
+            y = self.foreign_cy[led_id] + 0.5
+            z = self.foreign_cz[led_id] + 0.5
+
+        return self.get_plane_color(x, y, z, t)
+
+    @micropython.native
+    def get_color_batch(self, t, out_r, out_g, out_b):
+        """
+        Calculate colors for all LEDs in a single fused pass.
+        Scramble selection, rotation, smoothstep and color mix are inlined
+        per LED, with all frame-constant values hoisted out of the loop.
+        Uses the pre-centered self.cx/cy/cz coordinates.
+        """
+        # Cache self properties
+        n = self.num_leds
+        cx = self.cx
+        cy = self.cy
+        cz = self.cz
+        foreign_cx = self.foreign_cx
+        foreign_cy = self.foreign_cy
+        foreign_cz = self.foreign_cz
+        foreign_valid = self.foreign_valid
+        thresholds = self.swap_thresholds_int
+        scramble_strength_int = self.scramble_strength_int
+        cos_x = self.cos_x
+        sin_x = self.sin_x
+        cos_z = self.cos_z
+        sin_z = self.sin_z
+        edge = self.edge_smoothness
+        inv_edge2 = 1.0 / (edge * 2.0)
+
+        # Front/back colors are frame-constant (fixed-point, brightness applied),
+        # so the mix becomes back + front_side * (front - back) per channel
+        brightness = self.brightness
+        front_r, front_g, front_b = scale_color_brightness(
+            self.frame_front_r, self.frame_front_g, self.frame_front_b, brightness)
+        back_r, back_g, back_b = scale_color_brightness(
+            self.frame_back_r, self.frame_back_g, self.frame_back_b, brightness)
+        diff_r = front_r - back_r
+        diff_g = front_g - back_g
+        diff_b = front_b - back_b
+
+        for i in range(n):
+            # Scramble: binary swap between true and foreign positions
+            # (scramble_strength_int is 0-1000, frame-constant)
+            if scramble_strength_int > thresholds[i] and foreign_valid[i]:
+                px = foreign_cx[i]
+                py = foreign_cy[i]
+                pz = foreign_cz[i]
+            else:
+                px = cx[i]
+                py = cy[i]
+                pz = cz[i]
 
-        if scramble_strength_int > 0:
-            # Use pre-computed foreign LED ID (avoids hash call)
-            foreign_id = self.foreign_ids[led_id]
-            foreign_coord = self.coords[foreign_id]
+            # Inline rotation around X then Z axis; only Y is needed for sdf_plane
+            ry = py * cos_x - pz * sin_x
+            ry = px * sin_z + ry * cos_z
 
-            if foreign_coord is not None:
-                # Integer comparison (scramble_strength_int is 0-1000)
-                uses_foreign = scramble_strength_int > self.swap_thresholds_int[led_id]
+            # Inline sdf2side: branchless smoothstep (clamp, then Hermite),
+            # converted to Q10 fixed point (0-1024)
+            t_val = max(0.0, min(1.0, (ry + edge) * inv_edge2))
+            front_side = int((1.0 - t_val * t_val * (3.0 - 2.0 * t_val)) * 1024.0)
 
-                if uses_foreign:
-                    # Use foreign position
-                    final_x, final_y, final_z = foreign_coord
+            # Mix front and back colors (integer math), truncating to uint8 once:
+            # drop 12 color + 10 front_side fraction bits (stays below 2**30)
+            out_r[i] = ((back_r << 10) + diff_r * front_side) >> 22
+            out_g[i] = ((back_g << 10) + diff_g * front_side) >> 22
+            out_b[i] = ((back_b << 10) + diff_b * front_side) >> 22
 
-        # Center coordinates to [-0.5, 0.5]
-        px = final_x - 0.5
-        py = final_y - 0.5
-        pz = final_z - 0.5
+    @micropython.native
+    def get_plane_color(self, x, y, z, t):
+        """
+        Calculate plane color for an (already scrambled) position.
+        """
+        # Cache self properties
+        cos_x = self.cos_x
+        sin_x = self.sin_x
+        cos_z = self.cos_z
+        sin_z = self.sin_z
+        edge = self.edge_smoothness
+        back_r = self.frame_back_r * COLOR_SCALE
+        back_g = self.frame_back_g * COLOR_SCALE
+        back_b = self.frame_back_b * COLOR_SCALE
 
-        # Calculate rotation angles
-        rot_x = speed_x * t
-        rot_z = speed_z * t
+        # Front color computed once per frame by precompute_frame()
+        front_r = self.frame_front_r * COLOR_SCALE
+        front_g = self.frame_front_g * COLOR_SCALE
+        front_b = self.frame_front_b * COLOR_SCALE
 
-        # Inline rotation around X axis (using fast trig)
-        cos_x = fast_cos(rot_x)
-        sin_x = fast_sin(rot_x)
+        # Center coordinates to [-0.5, 0.5]
+        px = x - 0.5
+        py = y - 0.5
+        pz = z - 0.5
+
+        # Inline rotation around X axis (sin/cos precomputed per frame)
         ry = py * cos_x - pz * sin_x
         # rz = py * sin_x + pz * cos_x  # Not used - commented out for performance
 
-        # Inline rotation around Z axis (using fast trig)
-        cos_z = fast_cos(rot_z)
-        sin_z = fast_sin(rot_z)
+        # Inline rotation around Z axis (sin/cos precomputed per frame)
         # rx = px * cos_z - ry * sin_z  # Not used - commented out for performance
         ry = px * sin_z + ry * cos_z
 
         # Inline sdf_plane: just the Y coordinate of rotated position
         sdf_value = ry
 
-        # Inline sdf2side: smoothstep conversion
-        if sdf_value < -edge:
-            front_side = 1.0
-        elif sdf_value > edge:
-            front_side = 0.0
-        else:
-            # Smoothstep calculation inlined
-            t_val = (sdf_value + edge) / (edge * 2.0)
-            t_smooth = t_val * t_val * (3.0 - 2.0 * t_val)
-            front_side = 1.0 - t_smooth
+        # Inline sdf2side: branchless smoothstep (clamp, then Hermite)
+        t_val = max(0.0, min(1.0, (sdf_value + edge) / (edge * 2.0)))
+        front_side = 1.0 - t_val * t_val * (3.0 - 2.0 * t_val)
 
         # Mix front and back colors
         r = front_r * front_side + back_r * (1.0 - front_side)
@@ -3,8 +3,9 @@
 
 import micropython
 from animation_base import Animation
-from fast_math import fast_sin
-from color_hsv import hsv_to_rgb
+from fast_math import fast_sin, SIN_TABLE
+from color_hsv import hsv_to_rgb_int
+from color_utils import COLOR_ONE, COLOR_SCALE, rgb_to_fixed, scale_color_brightness
 
 
 class SphereAnimation(Animation):
@@ -38,31 +39,48 @@ class SphereAnimation(Animation):
         self.fg_g = 0.5
         self.fg_b = 0.0
 
+        # Per-frame foreground color as fixed-point (0-COLOR_ONE), set by precompute_frame()
+        self.frame_fg_r = 0
+        self.frame_fg_g = 0
+        self.frame_fg_b = 0
+
+    def precompute_frame(self, t):
+        """
+        Compute the foreground color once per frame instead of per LED.
+        """
+        # Auto mode: override foreground color with hue cycling
+        if self.auto_mode:
+            # Calculate current hue based on time and cycle duration
+            # Hue cycles from 0.0 to 1.0 over hue_cycle_duration seconds
+            current_hue = (t / self.hue_cycle_duration) % 1.0
+
+            # Convert HSV to RGB for the foreground color (integer math,
+            # hue and saturation as Q16, value as fixed-point color; s and v
+            # are clamped so every channel stays within 0-COLOR_ONE)
+            self.frame_fg_r, self.frame_fg_g, self.frame_fg_b = hsv_to_rgb_int(
+                int(current_hue * 65536),
+                int(max(0.0, min(1.0, self.auto_saturation)) * 65536),
+                int(max(0.0, min(1.0, self.auto_brightness)) * COLOR_ONE))
+        else:
+            # Use base foreground color
+            self.frame_fg_r, self.frame_fg_g, self.frame_fg_b = rgb_to_fixed(
+                self.fg_r, self.fg_g, self.fg_b)
+
     @micropython.native
     def get_color(self, x, y, z, t, led_id):
         """
         Calculate color - matches original JS implementation.
         """
         # Cache self properties
-        auto_mode = self.auto_mode
         radius = self.radius
         edge = self.edge_smoothness
         wobble_scale = self.wobble_scale
         wobble_speed = self.wobble_speed
 
-        # Auto mode: override foreground color with hue cycling
-        if auto_mode:
-            # Calculate current hue based on time and cycle duration
-            # Hue cycles from 0.0 to 1.0 over hue_cycle_duration seconds
-            current_hue = (t / self.hue_cycle_duration) % 1.0
-
-            # Convert HSV to RGB for the foreground color
-            fg_r, fg_g, fg_b = hsv_to_rgb(current_hue, self.auto_saturation, self.auto_brightness)
-        else:
-            # Use base foreground color
-            fg_r = self.fg_r
-            fg_g = self.fg_g
-            fg_b = self.fg_b
+        # Foreground color computed once per frame by precompute_frame()
+        fg_r = self.frame_fg_r * COLOR_SCALE
+        fg_g = self.frame_fg_g * COLOR_SCALE
+        fg_b = self.frame_fg_b * COLOR_SCALE
 
         # Center coordinates to [-0.5, 0.5]
         px = x - 0.5
@@ -86,16 +104,74 @@ class SphereAnimation(Animation):
 
         sdf = dist - radius
 
-        # Inline sdf2bri: smoothstep conversion
-        if sdf < -edge:
-            brightness = 1.0
-        elif sdf > edge:
-            brightness = 0.0
-        else:
-            # Smoothstep calculation inlined
-            t_val = (sdf + edge) / (edge * 2.0)
-            t_smooth = t_val * t_val * (3.0 - 2.0 * t_val)
-            brightness = 1.0 - t_smooth
+        # Inline sdf2bri: branchless smoothstep (clamp, then Hermite)
+        t_val = max(0.0, min(1.0, (sdf + edge) / (edge * 2.0)))
+        brightness = 1.0 - t_val * t_val * (3.0 - 2.0 * t_val)
 
         # Return color (bg is black, so just multiply)
         return (fg_r * brightness, fg_g * brightness, fg_b * brightness)
+
+    @micropython.native
+    def get_color_batch(self, t, out_r, out_g, out_b):
+        """
+        Calculate colors for all LEDs in a single fused pass.
+        Wobble, SDF and smoothstep are inlined per LED; the sine table
+        lookup is inlined too, so no function is called inside the loop.
+        Uses the pre-centered self.cx/cy/cz coordinates.
+        """
+        # Cache self properties
+        n = self.num_leds
+        cx = self.cx
+        cy = self.cy
+        cz = self.cz
+        radius = self.radius
+        edge = self.edge_smoothness
+        inv_edge2 = 1.0 / (edge * 2.0)
+        wobble_scale = self.wobble_scale
+        sin_table = SIN_TABLE
+
+        # Foreground color computed once per frame by precompute_frame(),
+        # with the global brightness applied (still fixed-point)
+        fg_r, fg_g, fg_b = scale_color_brightness(
+            self.frame_fg_r, self.frame_fg_g, self.frame_fg_b, self.brightness)
+
+        # Wobble phase offsets are constant across LEDs
+        anim_time = t * self.wobble_speed
+        phase_x = anim_time * 2.0
+        phase_y = anim_time * 1.7
+        phase_z = anim_time * 1.5
+
+        for i in range(n):
+            # Coordinates pre-centered to [-0.5, 0.5]
+            px = cx[i]
+            py = cy[i]
+            pz = cz[i]
+
+            # Inline wobble distortion with inlined fast_sin table lookups.
+            # The +65536 bias (a multiple of 256) makes int() truncation act as
+            # floor for angles > -1608 rad; here they are always > -10 rad
+            # (|p| <= 0.5 and the phases grow with t >= 0)
+            px += wobble_scale * sin_table[int((px * 10.0 + phase_x) * 40.7436654 + 65536.0) & 255]
+            py += wobble_scale * sin_table[int((py * 8.5 + phase_y) * 40.7436654 + 65536.0) & 255]
+            pz += wobble_scale * sin_table[int((pz * 9.2 + phase_z) * 40.7436654 + 65536.0) & 255]
+
+            # Inline sphere SDF: length(pos) - radius
+            dist_sq = px * px + py * py + pz * pz
+            if dist_sq < 0.0001:
+                dist = 0.0
+            else:
+                dist = dist_sq ** 0.5
+
+            sdf = dist - radius
+
+            # Inline sdf2bri: branchless smoothstep (clamp, then Hermite),
+            # converted to Q10 fixed point (0-1024)
+            t_val = max(0.0, min(1.0, (sdf + edge) * inv_edge2))
+            level = int((1.0 - t_val * t_val * (3.0 - 2.0 * t_val)) * 1024.0)
+
+            # Background is black, so just scale the foreground (integer math).
+            # Single truncation to uint8: drop 12 color + 10 level fraction bits
+            # (products stay below 2**30, i.e. MicroPython small ints)
+            out_r[i] = (fg_r * level) >> 22
+            out_g[i] = (fg_g * level) >> 22
+            out_b[i] = (fg_b * level) >> 22
@@ -42,3 +42,48 @@ def hsv_to_rgb(h, s, v):
         r, g, b = c, 0.0, x
 
     return (r + m, g + m, b + m)
+
+
+@micropython.native
+def hsv_to_rgb_int(h, s, v):
+    """
+    Convert HSV to RGB using integer math only.
+    Same color wheel as hsv_to_rgb(), but for FPU-less targets.
+
+    Args:
+        h: Hue as Q16 integer (0 to 65535 = 0.0 to 1.0, wraps)
+        s: Saturation as Q16 integer (0 to 65536 = 0.0 to 1.0, not clamped)
+        v: Value/Brightness as a non-negative integer in the output scale
+           (e.g. 0-255, or fixed-point COLOR_ONE from color_utils, not clamped)
+
+    Returns:
+        (r, g, b) tuple in the same scale as v
+    """
+    # Sector (0-5) and Q16 position within the sector
+    h6 = (h & 0xFFFF) * 6
+    sector = h6 >> 16
+    frac = h6 & 0xFFFF
+
+    c = (v * s) >> 16
+    # Rising edge in even sectors, falling edge in odd sectors
+    if sector & 1:
+        x = (c * (65536 - frac)) >> 16
+    else:
+        x = (c * frac) >> 16
+    m = v - c
+
+    # Determine which sector of the color wheel
+    if sector == 0:
+        r, g, b = c, x, 0
+    elif sector == 1:
+        r, g, b = x, c, 0
+    elif sector == 2:
+        r, g, b = 0, c, x
+    elif sector == 3:
+        r, g, b = 0, x, c
+    elif sector == 4:
+        r, g, b = x, 0, c
+    else:
+        r, g, b = c, 0, x
+
+    return (r + m, g + m, b + m)
@@ -1,6 +1,12 @@
 # Color Manipulation Utilities
 # HSV conversion, color mixing, brightness scaling
 
+# Fixed-point frame colors: 0-255 channel values with 12 fractional bits,
+# so per-LED integer math truncates once at the end instead of per step
+COLOR_FRAC_BITS = 12
+COLOR_ONE = 255 << COLOR_FRAC_BITS  # Full intensity
+COLOR_SCALE = 1.0 / COLOR_ONE       # Fixed-point to 0.0-1.0
+
 def hsv_to_rgb(h, s, v):
     """
     Convert HSV color to RGB.
@@ -105,13 +111,13 @@ def scale_color_brightness(r, g, b, brightness):
     Scale RGB values by brightness factor.
 
     Args:
-        r: Red (0-255)
-        g: Green (0-255)
-        b: Blue (0-255)
+        r: Red (any non-negative integer scale, e.g. 0-255 or 0-COLOR_ONE)
+        g: Green (same scale as r)
+        b: Blue (same scale as r)
         brightness: Brightness scale (0-255)
 
     Returns:
-        (r, g, b) tuple with scaled values (0-255)
+        (r, g, b) tuple with scaled values in the input scale
     """
     return (
         r * brightness // 255,
@@ -120,6 +126,22 @@ def scale_color_brightness(r, g, b, brightness):
     )
 
 
+def rgb_to_fixed(r, g, b):
+    """
+    Convert RGB floats to clamped fixed-point colors.
+
+    Args:
+        r, g, b: Color values (0.0 to 1.0, may be out of range)
+
+    Returns:
+        (r, g, b) tuple of integers 0 to COLOR_ONE
+    """
+    r = int(max(0.0, min(1.0, r)) * COLOR_ONE)
+    g = int(max(0.0, min(1.0, g)) * COLOR_ONE)
+    b = int(max(0.0, min(1.0, b)) * COLOR_ONE)
+    return (r, g, b)
+
+
 def clamp_rgb(r, g, b):
     """
     Clamp RGB values to valid 0-255 range.
@@ -1,8 +1,39 @@
 # Coordinate Loader - Parse and normalize LED positions from solution1.txt
 # Format: LED_0004 0.170590 -1.000000 -0.077250
 
+import array
 import config
 
+
+class Coordinates:
+    """
+    Normalized LED coordinates stored as structure-of-arrays.
+
+    xs, ys, zs are array('f') buffers indexed by LED ID and valid is a
+    bytearray marking LEDs that have a known position. Indexing and
+    iteration yield (x, y, z) tuples or None, like the plain list this
+    class replaces.
+    """
+
+    def __init__(self, num_leds):
+        self.xs = array.array('f', [0.0] * num_leds)
+        self.ys = array.array('f', [0.0] * num_leds)
+        self.zs = array.array('f', [0.0] * num_leds)
+        self.valid = bytearray(num_leds)
+
+    def __len__(self):
+        return len(self.valid)
+
+    def __getitem__(self, led_id):
+        if not self.valid[led_id]:
+            return None
+        return (self.xs[led_id], self.ys[led_id], self.zs[led_id])
+
+    def __iter__(self):
+        for led_id in range(len(self.valid)):
+            yield self[led_id]
+
+
 def load_coordinates(filename):
     """
     Load and normalize LED coordinates from file.
@@ -11,24 +42,29 @@ def load_coordinates(filename):
         filename: Path to coordinates file (solution1.txt)
 
     Returns:
-        List of (x, y, z) tuples normalized to [0.0, 1.0], or None for missing IDs
-        Index in list corresponds to LED ID from file
+        Coordinates object with positions normalized to [0.0, 1.0]
+        Index corresponds to LED ID from file
     """
-    raw_coords = []
+    # Raw parse results stored flat in typed arrays (no per-LED tuples)
+    ids = array.array('H')
+    raw_xs = array.array('f')
+    raw_ys = array.array('f')
+    raw_zs = array.array('f')
+
+    # Bounding box and max LED ID are tracked while parsing
+    max_led_id = -1
+    x_min = y_min = z_min = float('inf')
+    x_max = y_max = z_max = float('-inf')
 
     print(f"Loading coordinates from {filename}...")
 
-    # Pass 1: Parse all coordinates and find max LED ID
+    # Pass 1: Parse all coordinates, find max LED ID and bounding box
     try:
         with open(filename, 'r') as f:
             for line in f:
-                line = line.strip()
-
-                # Skip empty lines and comments
-                if not line or line.startswith('#'):
-                    continue
+                line = line.lstrip()
 
-                # Only process LED lines
+                # Only process LED lines (also skips empty lines and comments)
                 if not line.startswith('LED_'):
                     continue
 
@@ -37,64 +73,78 @@ def load_coordinates(filename):
                     continue
 
                 # Extract LED ID from LED_0004 -> 4
-                led_id_str = parts[0].split('_')[-1]
-                led_id = int(led_id_str)
+                led_id = int(parts[0][4:])
 
                 # Parse coordinates
                 x = float(parts[1])
                 y = float(parts[2])
                 z = float(parts[3])
 
-                raw_coords.append((led_id, x, y, z))
+                ids.append(led_id)
+                raw_xs.append(x)
+                raw_ys.append(y)
+                raw_zs.append(z)
+
+                if led_id > max_led_id:
+                    max_led_id = led_id
+                if x < x_min:
+                    x_min = x
+                if x > x_max:
+                    x_max = x
+                if y < y_min:
+                    y_min = y
+                if y > y_max:
+                    y_max = y
+                if z < z_min:
+                    z_min = z
+                if z > z_max:
+                    z_max = z
 
     except OSError as e:
         print(f"Error loading coordinates: {e}")
-        return []
+        return Coordinates(0)
 
-    if not raw_coords:
+    if not ids:
         print("No LED coordinates found in file!")
-        return []
+        return Coordinates(0)
 
-    print(f"Loaded {len(raw_coords)} LED positions")
-
-    # Find max LED ID to size the coordinate array
-    max_led_id = max(led_id for led_id, _, _, _ in raw_coords)
+    print(f"Loaded {len(ids)} LED positions")
     print(f"Max LED ID in file: {max_led_id}")
 
-    # Initialize coordinate list sized for all LEDs in file
-    coords = [None] * (max_led_id + 1)
-
-    # Pass 2: Find bounding box
-    xs = [c[1] for c in raw_coords]
-    ys = [c[2] for c in raw_coords]
-    zs = [c[3] for c in raw_coords]
-
-    x_min, x_max = min(xs), max(xs)
-    y_min, y_max = min(ys), max(ys)
-    z_min, z_max = min(zs), max(zs)
-
     print(f"Bounding box:")
     print(f"  X: [{x_min:.3f}, {x_max:.3f}]")
     print(f"  Y: [{y_min:.3f}, {y_max:.3f}]")
     print(f"  Z: [{z_min:.3f}, {z_max:.3f}]")
 
-    # Calculate ranges
+    # Normalize to [0.0, 1.0] with one multiply per axis
+    # Handle zero range (all coordinates same) by defaulting to 0.5
     x_range = x_max - x_min
     y_range = y_max - y_min
     z_range = z_max - z_min
-
-    # Pass 3: Normalize and store
-    for led_id, x, y, z in raw_coords:
-        # Normalize to [0.0, 1.0]
-        # Handle zero range (all coordinates same) by defaulting to 0.5
-        nx = (x - x_min) / x_range if x_range > 0 else 0.5
-        ny = (y - y_min) / y_range if y_range > 0 else 0.5
-        nz = (z - z_min) / z_range if z_range > 0 else 0.5
-
-        coords[led_id] = (nx, ny, nz)
+    x_scale = 1.0 / x_range if x_range > 0 else 0.0
+    y_scale = 1.0 / y_range if y_range > 0 else 0.0
+    z_scale = 1.0 / z_range if z_range > 0 else 0.0
+    x_offset = 0.0 if x_range > 0 else 0.5
+    y_offset = 0.0 if y_range > 0 else 0.5
+    z_offset = 0.0 if z_range > 0 else 0.5
+
+    # Initialize coordinate arrays sized for all LEDs in file
+    coords = Coordinates(max_led_id + 1)
+    xs_out = coords.xs
+    ys_out = coords.ys
+    zs_out = coords.zs
+    valid = coords.valid
+
+    # Pass 2: Normalize and store
+    for i in range(len(ids)):
+        led_id = ids[i]
+        xs_out[led_id] = (raw_xs[i] - x_min) * x_scale + x_offset
+        ys_out[led_id] = (raw_ys[i] - y_min) * y_scale + y_offset
+        zs_out[led_id] = (raw_zs[i] - z_min) * z_scale + z_offset
+        valid[led_id] = 1
 
     # Count how many LEDs have coordinates
-    loaded_count = sum(1 for c in coords if c is not None)
+    loaded_count = sum(valid)
     print(f"Normalized {loaded_count} LED coordinates to [0.0, 1.0] range")
 
     return coords
@@ -105,7 +155,7 @@ def get_coordinate(coords, led_id):
     Get normalized coordinate for a specific LED.
 
     Args:
-        coords: List from load_coordinates()
+        coords: Coordinates from load_coordinates()
         led_id: LED index (0-73)
 
     Returns:
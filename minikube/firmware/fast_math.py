@@ -1,13 +1,20 @@
 # Fast Math Utilities - Optimized for MicroPython
 # Uses lookup tables and native compilation
 
+import array
 import math
 import micropython
 
 # Precompute sin/cos lookup table (256 entries for 0-2π)
+# Stored as a typed float array: 1 KB of raw floats instead of a list of boxed objects
+# Public so fused render loops can inline the lookup done by fast_sin():
+# SIN_TABLE[math.floor(x * 40.7436654) & 255]  (40.7436654 = TABLE_SIZE / (2*pi))
 _TABLE_SIZE = 256
 _TABLE_SCALE = _TABLE_SIZE / (2 * math.pi)
-_sin_table = [math.sin(i * 2 * math.pi / _TABLE_SIZE) for i in range(_TABLE_SIZE)]
+SIN_TABLE = array.array('f', [math.sin(i * 2 * math.pi / _TABLE_SIZE) for i in range(_TABLE_SIZE)])
+
+# Q15 fixed-point copy of the table for integer-only (viper) code paths
+_sin_table_q15 = array.array('h', [int(32767 * math.sin(i * 2 * math.pi / _TABLE_SIZE)) for i in range(_TABLE_SIZE)])
 
 @micropython.native
 def fast_sin(x):
@@ -21,14 +28,10 @@ def fast_sin(x):
     Returns:
         Approximate sin(x)
     """
-    # Normalize to [0, 2π) and map to table index
-    # Using modulo and direct calculation
-    x = x % 6.28318531  # 2*pi
-    index = int(x * 40.7436654)  # TABLE_SIZE / (2*pi) precalculated
-    if index >= 256:
-        index = 255
-
-    return _sin_table[index]
+    # Map to table index and wrap with a bitmask (TABLE_SIZE is a power of two).
+    # floor() rounds negative angles down like the modulo did (int() would
+    # truncate them toward zero), so this is valid for any x
+    return SIN_TABLE[math.floor(x * 40.7436654) & 255]  # TABLE_SIZE / (2*pi) precalculated
 
 
 @micropython.native
@@ -37,6 +40,49 @@ def fast_cos(x):
     return fast_sin(x + 1.57079633)  # π/2 precalculated
 
 
+def radians_to_angle16(x):
+    """
+    Convert radians to a 16-bit binary angle for fast_sin_q/fast_cos_q.
+
+    Args:
+        x: Angle in radians
+
+    Returns:
+        Binary angle (0-65535, 65536 = one full turn)
+    """
+    return math.floor(x * 10430.3783505) & 0xFFFF  # 65536 / (2*pi)
+
+
+@micropython.viper
+def fast_sin_q(angle: int) -> int:
+    """
+    Integer sine using the Q15 lookup table.
+    Compiled with viper: integer register ops only, no float boxing.
+
+    Args:
+        angle: Binary angle (65536 = one full turn)
+
+    Returns:
+        sin(angle) as Q15 integer (-32767 to 32767)
+    """
+    table = ptr16(_sin_table_q15)
+    value = int(table[(angle >> 8) & 255])
+    # ptr16 reads are unsigned, sign-extend the 16-bit value
+    if value > 32767:
+        value -= 65536
+    return value
+
+
+@micropython.viper
+def fast_cos_q(angle: int) -> int:
+    """Integer cosine using the Q15 sin table (cos = sin(x + π/2))"""
+    table = ptr16(_sin_table_q15)
+    value = int(table[((angle + 16384) >> 8) & 255])
+    if value > 32767:
+        value -= 65536
+    return value
+
+
 def fast_length(x, y, z):
     """
     Fast approximate length/magnitude of 3D vector.
@@ -86,6 +132,7 @@ def smoothstep(edge0, edge1, x):
 
 
 # Precomputed constants
+Q15_SCALE = 1.0 / 32767.0
 PI = 3.14159265
 TWO_PI = 6.28318531
 HALF_PI = 1.57079633
@@ -1,8 +1,12 @@
 # Hash utilities for LED scrambling effect
 # Matches the hashLedId function from JS
 
+import array
 import micropython
 
+# Scramble tables per LED count, shared by all animation instances
+_scramble_table_cache = {}
+
 @micropython.native
 def hash_led_id(led_id, seed=42):
     """
@@ -26,3 +30,32 @@ def hash_led_id(led_id, seed=42):
     if h < 0:
         return -h
     return h
+
+
+def scramble_tables(num_leds):
+    """
+    Build lookup tables for the LED scrambling effect.
+    Tables are cached per LED count, so re-creating an animation
+    (e.g. when cycling with the button) does no hashing at all.
+
+    Args:
+        num_leds: Number of LEDs
+
+    Returns:
+        (foreign_ids, swap_thresholds) tuple of array('H'):
+        foreign LED ID (0 to num_leds-1) and swap threshold (0-999) per LED
+    """
+    tables = _scramble_table_cache.get(num_leds)
+    if tables is not None:
+        return tables
+
+    foreign_ids = array.array('H', [0] * num_leds)
+    swap_thresholds = array.array('H', [0] * num_leds)
+
+    for led_id in range(num_leds):
+        foreign_ids[led_id] = hash_led_id(led_id) % num_leds
+        swap_thresholds[led_id] = hash_led_id(led_id, 123) % 1000
+
+    tables = (foreign_ids, swap_thresholds)
+    _scramble_table_cache[num_leds] = tables
+    return tables
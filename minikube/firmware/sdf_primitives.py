@@ -3,6 +3,7 @@
 # SDF returns distance to surface: negative inside, zero on surface, positive outside
 
 import math
+import micropython
 from math_utils import smoothstep
 
 
@@ -86,10 +87,7 @@ def sdf_cross(pos, radius):
     Returns:
         Distance to closest cylinder surface
     """
-    dx = sdf_cylinder_x(pos, radius)
-    dy = sdf_cylinder_y(pos, radius)
-    dz = sdf_cylinder_z(pos, radius)
-    return min(dx, min(dy, dz))
+    return sdf_cross_xyz(pos.x, pos.y, pos.z, radius)
 
 
 def sdf2bri(sdf_value, ease=0.0):
@@ -105,28 +103,185 @@ def sdf2bri(sdf_value, ease=0.0):
         Brightness value (0.0 to 1.0)
     """
     if ease == 0.0:
-        # Hard edge
-        return 1.0 if sdf_value <= 0.0 else 0.0
+        # Hard edge (comparison converted to 0.0/1.0, no branch on sdf_value)
+        return float(sdf_value <= 0.0)
 
     # Soft edge using smoothstep
     return 1.0 - smoothstep(-ease, ease, sdf_value)
 
 
-def sdf2side(sdf_value, ease=0.0):
+# Convert SDF value to side indicator.
+# Negative side (inside) = 1.0, positive side (outside) = 0.0.
+# Same mapping as sdf2bri, so it shares the implementation.
+sdf2side = sdf2bri
+
+
+# Scalar-argument variants
+# Take x, y, z directly instead of a Vec3, so hot loops that already hold
+# coordinates as floats skip the object allocation and attribute lookups.
+
+@micropython.native
+def sdf_sphere_xyz(x, y, z, radius):
+    """Signed distance to sphere centered at origin (negative = inside)"""
+    return math.sqrt(x * x + y * y + z * z) - radius
+
+
+@micropython.native
+def sdf_cylinder_x_xyz(x, y, z, radius):
+    """Signed distance to infinite cylinder along X axis"""
+    return math.sqrt(y * y + z * z) - radius
+
+
+@micropython.native
+def sdf_cylinder_y_xyz(x, y, z, radius):
+    """Signed distance to infinite cylinder along Y axis"""
+    return math.sqrt(x * x + z * z) - radius
+
+
+@micropython.native
+def sdf_cylinder_z_xyz(x, y, z, radius):
+    """Signed distance to infinite cylinder along Z axis"""
+    return math.sqrt(x * x + y * y) - radius
+
+
+@micropython.native
+def sdf_cross_xyz(x, y, z, radius):
     """
-    Convert SDF value to side indicator.
-    Negative side (inside) = 1.0, positive side (outside) = 0.0.
+    Signed distance to cross shape (union of three perpendicular cylinders).
+    The cylinders are inlined and share a single sqrt.
+    """
+    x2 = x * x
+    y2 = y * y
+    z2 = z * z
+    return math.sqrt(min(y2 + z2, min(x2 + z2, x2 + y2))) - radius
+
+
+# Batched variants
+# Evaluate a whole LED strip in one call: positions are passed as three
+# coordinate arrays (e.g. array('f')) and results are written into a
+# preallocated output array, so no Vec3 objects or per-LED calls are needed.
+
+@micropython.native
+def sdf_sphere_v(xs, ys, zs, radius, out):
+    """
+    Signed distance to sphere centered at origin, for all positions.
 
     Args:
-        sdf_value: Signed distance value
-        ease: Smoothness of transition (0 = hard edge, >0 = soft edge)
+        xs, ys, zs: Position coordinate arrays
+        radius: Sphere radius
+        out: Output array receiving distances (negative = inside)
+    """
+    for i in range(len(out)):
+        x = xs[i]
+        y = ys[i]
+        z = zs[i]
+        out[i] = math.sqrt(x * x + y * y + z * z) - radius
+
+
+@micropython.native
+def sdf_cylinder_x_v(xs, ys, zs, radius, out):
+    """Signed distance to infinite cylinder along X axis, for all positions"""
+    for i in range(len(out)):
+        y = ys[i]
+        z = zs[i]
+        out[i] = math.sqrt(y * y + z * z) - radius
+
+
+@micropython.native
+def sdf_cylinder_y_v(xs, ys, zs, radius, out):
+    """Signed distance to infinite cylinder along Y axis, for all positions"""
+    for i in range(len(out)):
+        x = xs[i]
+        z = zs[i]
+        out[i] = math.sqrt(x * x + z * z) - radius
+
+
+@micropython.native
+def sdf_cylinder_z_v(xs, ys, zs, radius, out):
+    """Signed distance to infinite cylinder along Z axis, for all positions"""
+    for i in range(len(out)):
+        x = xs[i]
+        y = ys[i]
+        out[i] = math.sqrt(x * x + y * y) - radius
+
+
+@micropython.native
+def sdf_cross_v(xs, ys, zs, radius, out):
+    """
+    Signed distance to cross shape (union of three perpendicular cylinders),
+    for all positions. The three cylinders are fused into one pass.
 
-    Returns:
-        Side value (0.0 to 1.0)
+    Args:
+        xs, ys, zs: Position coordinate arrays
+        radius: Cylinder radius
+        out: Output array receiving distances to closest cylinder surface
+    """
+    for i in range(len(out)):
+        x2 = xs[i] * xs[i]
+        y2 = ys[i] * ys[i]
+        z2 = zs[i] * zs[i]
+        # min(sqrt(a), sqrt(b)) == sqrt(min(a, b)): one sqrt instead of three
+        out[i] = math.sqrt(min(y2 + z2, min(x2 + z2, x2 + y2))) - radius
+
+
+@micropython.native
+def sdf2bri_v(sdf_values, ease, out):
+    """
+    Convert SDF values to brightness, for all positions.
+    Inside/on surface = bright (1.0), outside = dark (0.0).
+
+    Args:
+        sdf_values: Array of signed distance values
+        ease: Smoothness of transition (0 = hard edge, >0 = soft edge)
+        out: Output array receiving brightness (0.0 to 1.0), may be sdf_values
     """
+    n = len(out)
+
     if ease == 0.0:
         # Hard edge
-        return 1.0 if sdf_value <= 0.0 else 0.0
+        for i in range(n):
+            out[i] = float(sdf_values[i] <= 0.0)
+        return
 
-    # Soft edge using smoothstep
-    return 1.0 - smoothstep(-ease, ease, sdf_value)
+    # Soft edge using inlined smoothstep(-ease, ease, sdf)
+    inv_width = 1.0 / (ease * 2.0)
+    for i in range(n):
+        t = max(0.0, min(1.0, (sdf_values[i] + ease) * inv_width))
+        out[i] = 1.0 - t * t * (3.0 - 2.0 * t)
+
+
+# Same mapping as sdf2bri_v (see sdf2side)
+sdf2side_v = sdf2bri_v
+
+
+@micropython.native
+def render_cross_u8(xs, ys, zs, radius, ease, out):
+    """
+    Render a cross shape straight into an RGB byte buffer in one fused pass
+    (sdf_cross -> sdf2bri -> 0-255 grey level, no intermediate arrays).
+
+    Args:
+        xs, ys, zs: Position coordinate arrays
+        radius: Cylinder radius
+        ease: Smoothness of transition (0 = hard edge, >0 = soft edge)
+        out: Output bytearray of 3 bytes per position (R, G, B)
+    """
+    n = len(out) // 3
+    inv_width = 1.0 / (ease * 2.0) if ease > 0.0 else 0.0
+
+    for i in range(n):
+        x2 = xs[i] * xs[i]
+        y2 = ys[i] * ys[i]
+        z2 = zs[i] * zs[i]
+        sdf = math.sqrt(min(y2 + z2, min(x2 + z2, x2 + y2))) - radius
+
+        if ease == 0.0:
+            level = 255 if sdf <= 0.0 else 0
+        else:
+            t = max(0.0, min(1.0, (sdf + ease) * inv_width))
+            level = int((1.0 - t * t * (3.0 - 2.0 * t)) * 255.0)
+
+        o = 3 * i
+        out[o] = level
+        out[o + 1] = level
+        out[o + 2] = level
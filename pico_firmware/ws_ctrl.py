@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 # Copyright (c) 2025 Philip Huppert. Licensed under the MIT License.
 
+import os
 import time
 import serial
 import struct
+import itertools
 import threading
 import argparse
 
@@ -11,6 +13,9 @@ NUM_LEDS = 200*6
 LEDS_PER_STRING = 200
 NUM_STRINGS = 6
 
+# Packet header: command, channel, little-endian 16-bit LED count
+_HDR = struct.Struct('<BBH')
+
 
 class WS2812Proxy:
     """Interface to WS2812 UART proxy on Pi Pico"""
@@ -42,6 +47,8 @@ class WS2812Proxy:
         #self.ser = SerMock()
         self.running = True
         self.buff = []
+        self._scratch = {}  # Per-channel packet buffers reused by send_frame()
+        self._queued = set()  # Channels whose scratch buffer is referenced by self.buff
 
         # Start reader thread to display messages from Pico
         self.reader_thread = threading.Thread(target=self._read_messages, daemon=True)
@@ -51,45 +58,135 @@ class WS2812Proxy:
 
     def _read_messages(self):
         """Read and display messages from Pico (runs in background thread)"""
+        pending = bytearray()
         while self.running:
             try:
-                if self.ser.in_waiting:
-                    line = self.ser.readline().decode('utf-8', errors='ignore').strip()
+                # Blocks for up to the port timeout (0.1 s) and returns whatever
+                # arrived, so several lines are decoded per read
+                chunk = self.ser.read(256)
+                if not chunk:
+                    continue
+                pending += chunk
+                end = pending.rfind(b'\n')
+                if end < 0:
+                    continue
+                for raw in pending[:end].split(b'\n'):
+                    line = raw.decode('utf-8', errors='ignore').strip()
                     if line:
                         print(f"[PICO] {line}")
+                del pending[:end + 1]
+            except serial.SerialException as e:
+                # Port is gone (e.g. Pico unplugged), retrying would just spin
+                print(f"[PICO] Reader stopped: {e}")
+                break
             except Exception:
-                pass
-            time.sleep(0.01)
+                time.sleep(0.01)
+
+    def _send_framed(self, data):
+        """Write frame data without waiting for it to be transmitted
+
+        Only control commands (reset, patterns, clear) call flush().
+        """
+        self.ser.write(memoryview(data))
+
+    def _send_vectored(self, chunks):
+        """Write several buffers with one scatter-gather writev() call
+
+        Avoids concatenating the queued packets in userspace. The port is
+        non-blocking, so anything the kernel doesn't accept right away is
+        handed to ser.write(), which waits for the port as usual.
+        """
+        views = [memoryview(c) for c in chunks]
+        try:
+            written = os.writev(self.ser.fileno(), views)
+        except BlockingIOError:
+            written = 0
+
+        # Drop fully written buffers, trim a partially written one
+        while views and written >= len(views[0]):
+            written -= len(views[0])
+            views.pop(0)
+        if views:
+            views[0] = views[0][written:]
+            self._send_framed(b"".join(views))
 
     def send_frame(self, channel, rgb_data, auto_flush=False):
         """Send RGB data to a specific channel
 
         Args:
             channel: Channel ID (0-7)
-            rgb_data: List of (R, G, B) tuples, each value 0-255
+            rgb_data: List of (R, G, B) tuples, each value 0-255, or an
+                (N, 3) array (e.g. numpy); contiguous uint8 arrays are copied directly
             auto_flush: If True, immediately update LEDs (default: True)
         """
         led_count = len(rgb_data)
+        try:
+            view = memoryview(rgb_data)
+        except TypeError:
+            view = None
+        if view is not None and not (view.format == 'B' and view.c_contiguous
+                                     and view.nbytes == 3 * led_count):
+            # Other dtypes (e.g. numpy's default int64) go value by value
+            view = None
+
+        if view is not None:
+            # Contiguous (N, 3) uint8 array: copy its bytes without an intermediate object
+            payload = view.cast('B')
+        else:
+            payload = bytes(itertools.chain.from_iterable(rgb_data))
+            if len(payload) != 3 * led_count:
+                raise ValueError("rgb_data must contain exactly 3 values per LED")
+
+        buf, size = self._start_packet(channel, led_count, auto_flush)
+        buf[_HDR.size:size] = payload
+        self._queue_packet(channel, memoryview(buf)[:size], auto_flush)
 
-        # Build packet
-        packet = bytearray()
-        packet.append(self.CMD_UPDATE_AND_FLUSH if auto_flush else self.CMD_UPDATE_ONLY)
-        packet.append(channel)
-        packet.extend(struct.pack('<H', led_count))  # Little-endian 16-bit LED count
+    def send_frame_solid(self, channel, r, g, b, led_count=LEDS_PER_STRING, auto_flush=False):
+        """Set all LEDs of a channel to one color
 
-        # Add RGB data for each LED
-        for i, (r, g, b) in enumerate(rgb_data):
-            # if channel == 7 and i != 164:
-            #     r = g = b = 0
-            packet.extend([r, g, b])
+        Args:
+            channel: Channel ID (0-7)
+            r, g, b: Color values 0-255
+            led_count: Number of LEDs (default: LEDS_PER_STRING)
+            auto_flush: If True, immediately update LEDs (default: False)
+        """
+        buf, size = self._start_packet(channel, led_count, auto_flush)
+        # Repeat the pixel in C instead of building a list of tuples
+        buf[_HDR.size:size] = bytes((r, g, b)) * led_count
+        self._queue_packet(channel, memoryview(buf)[:size], auto_flush)
 
-        # Send packet
+    def _start_packet(self, channel, led_count, auto_flush):
+        """Get the channel's scratch buffer with the packet header filled in
+
+        Returns:
+            (buffer, packet size) - the RGB data goes at _HDR.size:size
+        """
+        cmd = self.CMD_UPDATE_AND_FLUSH if auto_flush else self.CMD_UPDATE_ONLY
+        size = _HDR.size + 3 * led_count
+
+        # Reuse this channel's scratch buffer (regrown only for longer frames).
+        # If a packet queued for flush_channels() still references it, start a
+        # new one so the queued packet isn't overwritten.
+        buf = self._scratch.get(channel)
+        if buf is None or len(buf) < size or channel in self._queued:
+            buf = self._scratch[channel] = bytearray(max(size, _HDR.size + 3 * LEDS_PER_STRING))
+            self._queued.discard(channel)
+
+        # Packet: cmd, channel, little-endian 16-bit LED count, then RGB data
+        _HDR.pack_into(buf, 0, cmd, channel, led_count)
+        return buf, size
+
+    def _queue_packet(self, channel, packet, auto_flush):
+        """Send a frame packet now, or queue it for flush_channels()"""
         #print(f"[FRAME] {packet.hex()}")
         if auto_flush:
-            self.ser.write(packet)
-            self.ser.flush()
+            # Don't flush - frame data doesn't need to wait for the UART to drain
+            self._send_framed(packet)
         else:
+            # packet is a view of the channel's scratch buffer; mark it in use
+            # until flush_channels() has sent it
             self.buff.append(packet)
+            self._queued.add(channel)
 
     def flush_channels(self, channel_mask):
         """Flush specific channels to LEDs
@@ -99,10 +196,13 @@ class WS2812Proxy:
         """
         packet = bytes([self.CMD_FLUSH, channel_mask])
         self.buff.append(packet)
-        data = b"".join(self.buff)
-        self.ser.write(data)
+        if hasattr(os, 'writev') and hasattr(self.ser, 'fileno'):
+            self._send_vectored(self.buff)
+        else:
+            self._send_framed(b"".join(self.buff))
         # Don't flush - let OS buffer and send asynchronously for better throughput
         self.buff.clear()
+        self._queued.clear()  # Written out, scratch buffers can be reused
 
     def reset(self):
         """Reset the Pico"""
@@ -219,10 +319,8 @@ def main():
                     return 1
 
             print(f"Setting LEDs to RGB({args.r}, {args.g}, {args.b}) on channels {list(channels)}...")
-            rgb_data = [(args.r, args.g, args.b)] * LEDS_PER_STRING
-
             for channel in channels:
-                proxy.send_frame(channel, rgb_data, auto_flush=False)
+                proxy.send_frame_solid(channel, args.r, args.g, args.b, auto_flush=False)
 
             # Flush all updated channels
             channel_mask = sum(1 << c for c in channels)
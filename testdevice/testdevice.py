@@ -9,6 +9,7 @@ MicroPython program for ESP32-C3 LED test device
 """
 
 import machine
+import micropython
 import neopixel
 import time
 
@@ -26,9 +27,12 @@ FRAME_TIME = 10  # ms per frame (100 Hz)
 button = machine.Pin(BUTTON_PIN, machine.Pin.IN, machine.Pin.PULL_UP)
 np = neopixel.NeoPixel(machine.Pin(LED_PIN), NUM_LEDS)
 
+# Brightness scaling lookup table: _SCALED[v] == v * BRIGHTNESS // 255
+_SCALED = bytes(i * BRIGHTNESS // 255 for i in range(256))
+
 # Color constants (RGB) at low brightness
 def scale_color(r, g, b):
-    return (r * BRIGHTNESS // 255, g * BRIGHTNESS // 255, b * BRIGHTNESS // 255)
+    return (_SCALED[r], _SCALED[g], _SCALED[b])
 
 RED = scale_color(255, 0, 0)
 GREEN = scale_color(0, 255, 0)
@@ -47,7 +51,8 @@ COLOR_SEQUENCE_LONG = [RED, GREEN, BLUE, CYAN, MAGENTA, YELLOW]
 def hsv_to_rgb(h, s, v):
     """Convert HSV to RGB. h: 0-1, s: 0-1, v: 0-1. Returns (r, g, b) scaled by brightness."""
     if s == 0.0:
-        rgb = (int(v * 255), int(v * 255), int(v * 255))
+        c = _SCALED[int(v * 255)]
+        return (c, c, c)
     else:
         i = int(h * 6.0)
         f = (h * 6.0) - i
@@ -67,16 +72,51 @@ def hsv_to_rgb(h, s, v):
             rgb = (t, p, v)
         else:
             rgb = (v, p, q)
-        rgb = (int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255))
 
-    # Apply brightness scaling
-    return scale_color(rgb[0], rgb[1], rgb[2])
+    # Convert to 0-255 and apply brightness scaling
+    return (_SCALED[int(rgb[0] * 255)], _SCALED[int(rgb[1] * 255)], _SCALED[int(rgb[2] * 255)])
+
+def _build_rainbow_buf():
+    """Full-saturation rainbow (256 hue steps, brightness applied) as raw
+    pixel bytes in the strip's byte order, 3 bytes per entry"""
+    buf = bytearray(3 * 256)
+    order = np.ORDER
+    for i in range(256):
+        color = hsv_to_rgb(i / 256.0, 1.0, 1.0)
+        for j in range(3):
+            buf[3 * i + order[j]] = color[j]
+    return buf
+
+RAINBOW_BUF = _build_rainbow_buf()
+
+# Fast fill helpers (write straight into np.buf)
+@micropython.viper
+def _fill(buf: ptr8, start: int, end: int, b0: int, b1: int, b2: int):
+    """Set pixels [start, end) to the given bytes, in strip byte order"""
+    i = start * 3
+    stop = end * 3
+    while i < stop:
+        buf[i] = b0
+        buf[i + 1] = b1
+        buf[i + 2] = b2
+        i += 3
+
+def fill_range(start, end, color):
+    """Set LEDs [start, end) to an (r, g, b) color"""
+    # Reorder the color into the strip's byte order (e.g. GRB), as np[i] = color would
+    order = np.ORDER
+    px = [0, 0, 0]
+    px[order[0]] = color[0]
+    px[order[1]] = color[1]
+    px[order[2]] = color[2]
+    _fill(np.buf, start, end, px[0], px[1], px[2])
 
 # Mode base class
 class Mode:
     def __init__(self, current_time):
         """Initialize mode with current time"""
-        pass
+        # Set whenever update() changes np; the main loop only writes dirty frames
+        self.dirty = True
 
     def update(self, current_time):
         """Update LED state - must be implemented by subclasses"""
@@ -95,10 +135,10 @@ class Mode1(Mode):
         # Color cycle every 250ms
         if time.ticks_diff(current_time, self.last_color_change) >= 500:
             color = COLOR_SEQUENCE_BW[self.color_idx]
-            for i in range(EXTERNAL_START, EXTERNAL_END + 1):
-                np[i] = color
+            fill_range(EXTERNAL_START, EXTERNAL_END + 1, color)
             self.color_idx = (self.color_idx + 1) % len(COLOR_SEQUENCE_BW)
             self.last_color_change = current_time
+            self.dirty = True
 
         # Flash first and last LED alternating at 125ms
         if time.ticks_diff(current_time, self.last_flash) >= 250:
@@ -110,6 +150,7 @@ class Mode1(Mode):
                 np[EXTERNAL_END] = WHITE
             self.flash_state = not self.flash_state
             self.last_flash = current_time
+            self.dirty = True
 
 class Mode2(Mode):
     """Mode 2: Minimal blink - first and last LED red alternating"""
@@ -129,6 +170,7 @@ class Mode2(Mode):
                 np[EXTERNAL_END] = RED
             self.flash_state = not self.flash_state
             self.last_flash = current_time
+            self.dirty = True
 
 class Mode3(Mode):
     """Mode 3: Chase - fill strip one LED at a time, cycling through colors"""
@@ -151,6 +193,7 @@ class Mode3(Mode):
                 self.color_idx = (self.color_idx + 1) % len(COLOR_SEQUENCE_LONG)
 
             self.last_update = current_time
+            self.dirty = True
 
 class Mode4(Mode):
     """Mode 4: Shifting rainbow - hue cycle repeated 3 times across strip"""
@@ -160,40 +203,46 @@ class Mode4(Mode):
         self.last_update = current_time
         self.num_repetitions = 3  # Number of rainbow cycles across the strip
 
+    @micropython.native
     def update(self, current_time):
         # Update animation every 50ms
         if time.ticks_diff(current_time, self.last_update) >= 50:
             strip_length = EXTERNAL_END - EXTERNAL_START + 1
 
-            for i in range(EXTERNAL_START, EXTERNAL_END + 1):
-                led_position = i - EXTERNAL_START
-                # Calculate hue based on position and phase offset
-                hue = ((led_position / strip_length) * self.num_repetitions + self.phase_offset) % 1.0
-                color = hsv_to_rgb(hue, 1.0, 1.0)
-                np[i] = color
+            # Hue in rainbow table steps: per-LED step and phase offset
+            step = (self.num_repetitions / strip_length) * 256
+            base = self.phase_offset * 256
+
+            # Copy pixel bytes from the rainbow table straight into np.buf
+            buf = np.buf
+            palette = RAINBOW_BUF
+            offset = EXTERNAL_START * 3
+            for led_position in range(strip_length):
+                j = (int(base + led_position * step) & 0xFF) * 3
+                buf[offset] = palette[j]
+                buf[offset + 1] = palette[j + 1]
+                buf[offset + 2] = palette[j + 2]
+                offset += 3
 
             # Increment phase to create shifting effect
             self.phase_offset = (self.phase_offset + 0.01) % 1.0
             self.last_update = current_time
+            self.dirty = True
 
 def clear_all():
     """Turn off all LEDs"""
-    for i in range(NUM_LEDS):
-        np[i] = BLACK
+    fill_range(0, NUM_LEDS, BLACK)
     np.write()
 
 def clear_external():
     """Turn off only external LEDs (preserve internal LEDs)"""
-    for i in range(EXTERNAL_START, NUM_LEDS):
-        np[i] = BLACK
+    fill_range(EXTERNAL_START, NUM_LEDS, BLACK)
 
 def set_mode_indicator(mode):
     """Set internal LEDs to indicate current mode (1-4 LEDs lit)"""
-    for i in range(BUILTIN_LEDS):
-        if i < mode:
-            np[i] = RED
-        else:
-            np[i] = BLACK
+    lit = min(mode, BUILTIN_LEDS)
+    fill_range(0, lit, RED)
+    fill_range(lit, BUILTIN_LEDS, BLACK)
 
 def main():
     print("LED Test Device Starting...")
@@ -251,8 +300,10 @@ def main():
         # Update current mode
         current_mode.update(current_time)
 
-        # Write to LEDs
-        np.write()
+        # Write to LEDs (only if the frame changed)
+        if current_mode.dirty:
+            np.write()
+            current_mode.dirty = False
 
         # Maintain fixed frame rate
         frame_time = time.ticks_diff(time.ticks_ms(), frame_start)
@@ -8,7 +8,7 @@ import serial
 from pathlib import Path
 import time
 import threading
-import queue
+from collections import deque
 
 current_ws = None
 serial_port_path = None
@@ -16,20 +16,35 @@ serial_port_path = None
 class SerialThread:
     def __init__(self, port_path):
         self.port_path = port_path
-        self.tx_queue = queue.Queue()
+        self.tx = deque()
+        self.tx_event = threading.Event()
         self.rx_queue = asyncio.Queue()
         self.stop_event = threading.Event()
         self.write_thread = None
         self.read_thread = None
         self.serial_port = None
-
-    def start(self):
+        self._loop = None
+        # Currently attached (websocket, [msgs, bytes] counters), or None
+        self.sink = None
+        # Pending close tasks, referenced here so they aren't garbage collected
+        self._close_tasks = set()
+
+    def start(self, loop):
+        # Event loop that owns rx_queue; the reader thread hands data to it
+        self._loop = loop
+        self.open()
+
+    def open(self):
+        """(Re)open the serial port and start the reader/writer threads"""
+        self.stop()  # Clean up threads and port from a previous run, if any
         self.stop_event.clear()
+        self.tx_event.clear()
+        self.tx.clear()  # Don't replay data queued for a port that went away
         self.serial_port = serial.Serial(
             self.port_path,
             baudrate=115200,
             timeout=0.01,
-            write_timeout=0,
+            write_timeout=None,  # Blocking writes: write() returns once all data is queued
             inter_byte_timeout=None
         )
         self.write_thread = threading.Thread(target=self._write_loop, daemon=True)
@@ -39,43 +54,117 @@ class SerialThread:
 
     def stop(self):
         self.stop_event.set()
+        self.tx_event.set()  # Wake up the writer
         if self.write_thread:
             self.write_thread.join(timeout=1)
         if self.read_thread:
             self.read_thread.join(timeout=1)
         if self.serial_port:
             self.serial_port.close()
+            self.serial_port = None
+
+    def is_running(self):
+        threads = (self.write_thread, self.read_thread)
+        return all(t is not None and t.is_alive() for t in threads) and not self.stop_event.is_set()
+
+    def ensure_open(self):
+        """Reopen the port if it failed (e.g. the Pico was reset or re-enumerated)"""
+        if not self.is_running():
+            self.open()
+
+    def _failed(self, error):
+        """Called from a serial thread when the port stops working"""
+        if self.stop_event.is_set():
+            return  # Shutting down (or the other thread already reported it)
+        # Stop the other thread too; the next connection reopens the port
+        self.stop_event.set()
+        self.tx_event.set()
+        self._loop.call_soon_threadsafe(self._report_failure, error)
+
+    def _report_failure(self, error):
+        print(f'[ERROR] Serial port failed: {error}')
+        sink = self.sink
+        if sink is not None:
+            task = asyncio.create_task(sink[0].close(code=1011, message=b'Serial port error'))
+            self._close_tasks.add(task)
+            task.add_done_callback(self._close_tasks.discard)
 
     def _write_loop(self):
         while not self.stop_event.is_set():
             try:
-                data = self.tx_queue.get(timeout=0.001)
-                self.serial_port.write(data)
-                self.serial_port.flush()
-            except queue.Empty:
-                pass
-            except Exception:
+                # Block until there is data instead of polling; no flush(),
+                # the OS buffer drains to the UART on its own. write() blocks
+                # while that buffer is full, so no data is dropped
+                self.tx_event.wait()
+                self.tx_event.clear()
+                # Coalesce everything queued so far into a single write
+                tx = self.tx
+                if len(tx) == 1:
+                    self._write_all(tx.popleft())
+                elif tx:
+                    chunks = []
+                    while tx:
+                        chunks.append(tx.popleft())
+                    self._write_all(b''.join(chunks))
+            except Exception as e:
+                self._failed(e)
                 break
 
+    def _write_all(self, data):
+        # A coalesced write carries several messages, so never let a short
+        # write drop its tail (blocking writes return everything anyway)
+        view = memoryview(data)
+        while view:
+            written = self.serial_port.write(view)
+            if not written:
+                raise serial.SerialTimeoutException('Serial write made no progress')
+            view = view[written:]
+
     def _read_loop(self):
         while not self.stop_event.is_set():
             try:
                 data = self.serial_port.read(1024)
                 if data:
-                    asyncio.run_coroutine_threadsafe(
-                        self.rx_queue.put(data),
-                        asyncio.get_event_loop()
-                    )
-            except Exception:
+                    self._loop.call_soon_threadsafe(self.rx_queue.put_nowait, data)
+            except Exception as e:
+                self._failed(e)
                 break
-            time.sleep(0.001)
 
     def write(self, data):
-        self.tx_queue.put(data)
+        self.tx.append(data)
+        self.tx_event.set()
 
     async def read(self):
         return await self.rx_queue.get()
 
+    def attach(self, ws, stats):
+        """Make ws the receiver of serial data; stats is a [msgs, bytes] list it counts into"""
+        # Drop anything received while no client was connected
+        while not self.rx_queue.empty():
+            self.rx_queue.get_nowait()
+        self.sink = (ws, stats)
+
+    def detach(self, ws):
+        if self.sink is not None and self.sink[0] is ws:
+            self.sink = None
+
+    async def forward_rx(self):
+        """Forward serial data to the attached websocket (runs for the app's lifetime)"""
+        while True:
+            data = await self.read()
+            sink = self.sink
+            if sink is None:
+                continue
+            ws, stats = sink
+            try:
+                await ws.send_bytes(data)
+            except Exception:
+                continue
+            stats[0] += 1
+            stats[1] += len(data)
+
+serial_key = web.AppKey('serial', SerialThread)
+
 async def handle_websocket(request):
     global current_ws
 
@@ -84,6 +173,14 @@ async def handle_websocket(request):
     if current_ws is not None and not force:
         return web.Response(text='Serial port already in use', status=409)
 
+    # Serial port is opened once and shared across sessions; reopen it if it failed
+    serial_thread = request.app[serial_key]
+    try:
+        serial_thread.ensure_open()
+    except (serial.SerialException, OSError) as e:
+        print(f'[ERROR] Cannot open serial port {serial_port_path}: {e}')
+        return web.Response(text=f'Serial port unavailable: {e}', status=503)
+
     if current_ws is not None and force:
         print('[INFO] Force takeover requested, closing existing connection')
         await current_ws.close(code=1000, message=b'Connection taken over')
@@ -95,30 +192,15 @@ async def handle_websocket(request):
 
     ws_to_serial_msgs = 0
     ws_to_serial_bytes = 0
-    serial_to_ws_msgs = 0
-    serial_to_ws_bytes = 0
+    serial_to_ws = [0, 0]  # msgs, bytes - counted by the serial bridge
 
     client_ip = request.remote
     print(f'[SESSION START] Client connected from {client_ip}')
     session_start = time.time()
 
-    serial_thread = SerialThread(serial_port_path)
-    serial_thread.start()
+    serial_thread.attach(ws, serial_to_ws)
 
     try:
-        async def serial_reader():
-            nonlocal serial_to_ws_msgs, serial_to_ws_bytes
-            while not ws.closed:
-                try:
-                    data = await asyncio.wait_for(serial_thread.read(), timeout=0.1)
-                    await ws.send_bytes(data)
-                    serial_to_ws_msgs += 1
-                    serial_to_ws_bytes += len(data)
-                except asyncio.TimeoutError:
-                    continue
-                except Exception:
-                    break
-
         async def stats_reporter():
             last_ws_msgs = 0
             last_ws_bytes = 0
@@ -133,6 +215,7 @@ async def handle_websocket(request):
 
                 ws_msg_rate = (ws_to_serial_msgs - last_ws_msgs) / elapsed
                 ws_byte_rate = (ws_to_serial_bytes - last_ws_bytes) / elapsed
+                serial_to_ws_msgs, serial_to_ws_bytes = serial_to_ws
                 serial_msg_rate = (serial_to_ws_msgs - last_serial_msgs) / elapsed
                 serial_byte_rate = (serial_to_ws_bytes - last_serial_bytes) / elapsed
 
@@ -144,7 +227,6 @@ async def handle_websocket(request):
                 last_serial_bytes = serial_to_ws_bytes
                 last_time = now
 
-        reader_task = asyncio.create_task(serial_reader())
         stats_task = asyncio.create_task(stats_reporter())
 
         async for msg in ws:
@@ -155,28 +237,43 @@ async def handle_websocket(request):
             elif msg.type == WSMsgType.ERROR:
                 break
 
-        reader_task.cancel()
         stats_task.cancel()
-        try:
-            await reader_task
-        except asyncio.CancelledError:
-            pass
         try:
             await stats_task
         except asyncio.CancelledError:
             pass
 
     finally:
-        serial_thread.stop()
+        serial_thread.detach(ws)
 
         session_duration = time.time() - session_start
-        print(f'[SESSION END] Duration: {session_duration:.1f}s | WS→Serial: {ws_to_serial_msgs} msgs, {ws_to_serial_bytes} bytes | Serial→WS: {serial_to_ws_msgs} msgs, {serial_to_ws_bytes} bytes')
+        print(f'[SESSION END] Duration: {session_duration:.1f}s | WS→Serial: {ws_to_serial_msgs} msgs, {ws_to_serial_bytes} bytes | Serial→WS: {serial_to_ws[0]} msgs, {serial_to_ws[1]} bytes')
 
         if current_ws == ws:
             current_ws = None
 
     return ws
 
+async def serial_bridge(app):
+    """Open the serial port once for the app's lifetime"""
+    serial_thread = SerialThread(serial_port_path)
+    try:
+        serial_thread.start(asyncio.get_running_loop())
+    except (serial.SerialException, OSError) as e:
+        # Keep serving; each new connection retries opening the port
+        print(f'[WARN] Cannot open serial port {serial_port_path}: {e}')
+    app[serial_key] = serial_thread
+    forward_task = asyncio.create_task(serial_thread.forward_rx())
+
+    yield
+
+    forward_task.cancel()
+    try:
+        await forward_task
+    except asyncio.CancelledError:
+        pass
+    serial_thread.stop()
+
 async def handle_index(request):
     html_path = Path(__file__).parent / 'index.html'
     return web.FileResponse(html_path)
@@ -208,6 +305,7 @@ def main():
     app = web.Application(middlewares=[cors_middleware])
     app.router.add_get('/', handle_index)
     app.router.add_get('/ws', handle_websocket)
+    app.cleanup_ctx.append(serial_bridge)
 
     web.run_app(app, host=args.host, port=args.port)
 